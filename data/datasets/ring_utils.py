@@ -1,44 +1,46 @@
 import numpy as np
 import torch
-import random
 
 from torch_geometric.data import Data
-from sklearn.preprocessing import LabelBinarizer
+from data.parallel import ProgressParallel
+from joblib import delayed
+
+
+def make_ring_edge_index(nodes):
+    """Builds the bidirectional edge index of a ring on the given number of nodes."""
+    src = torch.arange(nodes, dtype=torch.long)
+    dst = src.roll(-1)
+    return torch.cat([torch.stack([src, dst]), torch.stack([dst, src])], dim=1)
 
 
 # TODO: Add a graph dataset for ring lookup.
-def generate_ring_lookup_graph(nodes):
+def generate_ring_lookup_graph(nodes, seed=None, edge_index=None):
     """This generates a dictionary lookup ring. No longer being used for now."""
-    # Assign all the other nodes in the ring a unique key and value
-    keys = np.arange(1, nodes)
-    vals = np.random.permutation(nodes - 1)
-
-    oh_keys = np.array(LabelBinarizer().fit_transform(keys))
-    oh_vals = np.array(LabelBinarizer().fit_transform(vals))
-    oh_all = np.concatenate((oh_keys, oh_vals), axis=-1)
-    x = np.empty((nodes, oh_all.shape[1]))
-    x[1:, :] = oh_all
+    rng = np.random.default_rng(seed)
+    # Assign all the other nodes in the ring a unique key and value.
+    # The sorted keys 1, ..., nodes-1 one-hot encode to the identity matrix,
+    # so the features can be assembled by row-indexing it instead of fitting
+    # a LabelBinarizer per sample.
+    oh = np.eye(nodes - 1, dtype=np.float32)
+    vals = rng.permutation(nodes - 1)
+
+    x = np.empty((nodes, 2 * (nodes - 1)), dtype=np.float32)
+    x[1:, :nodes - 1] = oh
+    x[1:, nodes - 1:] = oh[vals]
 
     # Assign the source node one of these random keys and set the value to -1
-    key_idx = random.randint(0, nodes - 2)
+    key_idx = int(rng.integers(0, nodes - 1))
     val = vals[key_idx]
 
     x[0, :] = 0
-    x[0, :oh_keys.shape[1]] = oh_keys[key_idx]
+    x[0, :nodes - 1] = oh[key_idx]
 
-    x = torch.tensor(x, dtype=torch.float32)
+    x = torch.from_numpy(x)
 
-    edge_index = []
-    for i in range(nodes-1):
-        edge_index.append([i, i + 1])
-        edge_index.append([i + 1, i])
-
-    # Add the edges that close the ring
-    edge_index.append([0, nodes - 1])
-    edge_index.append([nodes - 1, 0])
-
-    edge_index = np.array(edge_index, dtype=np.long).T
-    edge_index = torch.tensor(edge_index, dtype=torch.long)
+    # The ring skeleton is the same for every sample, so it can be precomputed
+    # once by the caller and shared across samples.
+    if edge_index is None:
+        edge_index = make_ring_edge_index(nodes)
 
     # Create a mask for the target node of the graph
     mask = torch.zeros(nodes, dtype=torch.bool)
@@ -50,11 +52,12 @@ def generate_ring_lookup_graph(nodes):
 
 
 def generate_ringlookup_graph_dataset(nodes, samples=10000):
-    # Generate the dataset
-    dataset = []
-    for i in range(samples):
-        graph = generate_ring_lookup_graph(nodes)
-        dataset.append(graph)
+    # Generate the dataset. The samples are independent, so they are produced
+    # in parallel, each with a fixed per-sample seed to keep the output reproducible.
+    edge_index = make_ring_edge_index(nodes)
+    parallel = ProgressParallel(n_jobs=-1, use_tqdm=True, total=samples, batch_size=256)
+    dataset = parallel(delayed(generate_ring_lookup_graph)(nodes, seed, edge_index)
+                       for seed in range(samples))
     return dataset
 
 
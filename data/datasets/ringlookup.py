@@ -1,9 +1,69 @@
 import torch
+import functools
+import os
 import os.path as osp
 
+from data.complex import Cochain
 from data.datasets import InMemoryComplexDataset
 from data.datasets.ring_utils import generate_ringlookup_graph_dataset
-from data.utils import convert_graph_dataset_with_rings
+from data.utils import convert_graph_dataset_with_rings, sort_index_by_target
+from definitions import ROOT_DIR
+
+
+def pack_collated(data, slices, max_dim):
+    """Flattens the collated cochain storage into plain dicts of tensors.
+
+    Cochain wrappers pickle as a graph of many small Python objects. Keeping
+    only tensors and lists in the saved structure makes serialisation cheaper
+    and keeps the file compatible with memory-mapped loading.
+    """
+    cochains = {}
+    for dim in range(max_dim + 1):
+        cochain = data[dim]
+        cochains[dim] = {
+            'keys': {key: cochain[key] for key in cochain.keys},
+            'num_cells': cochain.__num_cells__,
+            'num_cells_up': cochain.__num_cells_up__,
+            'num_cells_down': cochain.__num_cells_down__,
+        }
+    return {'labels': data['labels'], 'dims': data['dims'],
+            'cochains': cochains, 'slices': slices, 'max_dim': max_dim}
+
+
+def _load_packed(path):
+    """Loads the packed dataset, memory-mapping the tensor storage if possible.
+
+    With mmap, tensors are paged in from the zipfile on first access instead of
+    being copied into memory up front, which makes opening the dataset cheap.
+    torch.load only grew the mmap/weights_only arguments in recent versions, so
+    older installations fall back to a regular load.
+    """
+    try:
+        return torch.load(path, mmap=True, weights_only=True)
+    except TypeError:
+        return torch.load(path)
+
+
+def unpack_collated(packed):
+    """The inverse of pack_collated: rebuilds the collated (data, slices) pair.
+
+    Features saved in bfloat16 are restored to full precision here. The cast
+    must happen before the tensor is attached to the cochain: the x property
+    setter validates num_cells, which is a per-sample list on collated storage.
+    """
+    data = {'labels': packed['labels'], 'dims': packed['dims']}
+    for dim in range(packed['max_dim'] + 1):
+        stored = packed['cochains'][dim]
+        cochain = Cochain(dim)
+        for key, item in stored['keys'].items():
+            if isinstance(item, torch.Tensor) and item.dtype == torch.bfloat16:
+                item = item.float()
+            cochain[key] = item
+        cochain.__num_cells__ = stored['num_cells']
+        cochain.__num_cells_up__ = stored['num_cells_up']
+        cochain.__num_cells_down__ = stored['num_cells_down']
+        data[dim] = cochain
+    return data, packed['slices']
 
 
 class RingLookupDataset(InMemoryComplexDataset):
@@ -19,7 +79,9 @@ class RingLookupDataset(InMemoryComplexDataset):
         super(RingLookupDataset, self).__init__(
             root, None, None, None, max_dim=2, cellular=True, num_classes=nodes-1)
 
-        self.data, self.slices = torch.load(self.processed_paths[0])
+        # Features are stored in bfloat16 to halve the file size and the load
+        # bandwidth; unpack_collated restores them to full precision.
+        self.data, self.slices = unpack_collated(_load_packed(self.processed_paths[0]))
         idx = torch.load(self.processed_paths[1])
 
         self.train_ids = idx[0]
@@ -33,7 +95,8 @@ class RingLookupDataset(InMemoryComplexDataset):
 
     @property
     def processed_file_names(self):
-        return [f'ringlookup-n{self._nodes}.pkl', f'idx-n{self._nodes}.pkl']
+        # The .pt extension marks the flat tensor-only format of pack_collated.
+        return [f'ringlookup-n{self._nodes}.pt', f'idx-n{self._nodes}.pkl']
 
     @property
     def raw_file_names(self):
@@ -45,9 +108,9 @@ class RingLookupDataset(InMemoryComplexDataset):
         pass
 
     def process(self):
-        train = generate_ringlookup_graph_dataset(self._nodes, samples=10000)
-        val = generate_ringlookup_graph_dataset(self._nodes, samples=1000)
-        dataset = train + val
+        # A single dispatch for train + val halves the parallelisation overhead.
+        dataset = generate_ringlookup_graph_dataset(self._nodes, samples=11000)
+        train, val = dataset[:10000], dataset[10000:]
 
         train_ids = list(range(len(train)))
         val_ids = list(range(len(train), len(train) + len(val)))
@@ -67,14 +130,48 @@ class RingLookupDataset(InMemoryComplexDataset):
             mask[0] = 1
             setattr(complex.cochains[0], 'mask', mask)
 
-            # Make HOF zero
-            complex.edges.x = torch.zeros_like(complex.edges.x)
-            complex.two_cells.x = torch.zeros_like(complex.two_cells.x)
+            # Make HOF zero. The in-place zeroing avoids allocating a fresh
+            # tensor per complex like `zeros_like` would.
+            complex.edges.x.zero_()
+            complex.two_cells.x.zero_()
             assert complex.two_cells.num_cells == 1
 
+            # The one-hot key/value features are exactly representable in
+            # bfloat16, so they can be stored at half the size.
+            for cochain in complex.cochains.values():
+                if cochain.x is not None:
+                    cochain.x = cochain.x.to(torch.bfloat16)
+
+            # Sort the adjacencies by target cell. Batching only offsets the
+            # cell ids, so aggregation can then run on a CSR layout end-to-end.
+            for cochain in complex.cochains.values():
+                if cochain.upper_index is not None:
+                    cochain.upper_index, cochain.shared_coboundaries = sort_index_by_target(
+                        cochain.upper_index, cochain.shared_coboundaries)
+                if cochain.lower_index is not None:
+                    cochain.lower_index, cochain.shared_boundaries = sort_index_by_target(
+                        cochain.lower_index, cochain.shared_boundaries)
+
+        # Every sample has the same ring topology, so point the structural
+        # tensors of all complexes at the first complex's copies instead of
+        # keeping thousands of identical tensors alive until collation.
+        canonical = complexes[0]
+        shared_keys = ['upper_index', 'lower_index', 'shared_coboundaries',
+                       'shared_boundaries', 'boundary_index', 'mask', 'x']
+        for complex in complexes[1:]:
+            for dim, cochain in complex.cochains.items():
+                canon = canonical.cochains[dim]
+                for key in shared_keys:
+                    value = getattr(cochain, key, None)
+                    ref = getattr(canon, key, None)
+                    if (isinstance(value, torch.Tensor) and isinstance(ref, torch.Tensor)
+                            and value.dtype == ref.dtype and torch.equal(value, ref)):
+                        setattr(cochain, key, ref)
+
         path = self.processed_paths[0]
         print(f'Saving processed dataset in {path}....')
-        torch.save(self.collate(complexes, 2), path)
+        data, slices = self.collate(complexes, 2)
+        torch.save(pack_collated(data, slices, 2), path, _use_new_zipfile_serialization=True)
 
         idx = [train_ids, val_ids, None]
 
@@ -83,9 +180,19 @@ class RingLookupDataset(InMemoryComplexDataset):
         torch.save(idx, path)
 
 
+@functools.lru_cache(maxsize=4)
 def load_ring_lookup_dataset(nodes=10):
-    train = generate_ringlookup_graph_dataset(nodes, samples=10000)
-    val = generate_ringlookup_graph_dataset(nodes, samples=1000)
+    # Memoised both in memory (repeated calls within a process) and on disk
+    # (repeated runs), so the graphs are only ever generated once.
+    cache_dir = osp.join(ROOT_DIR, 'datasets', 'RING-LOOKUP', 'graph')
+    cache_path = osp.join(cache_dir, f'ringlookup-n{nodes}.pt')
+    if osp.exists(cache_path):
+        train, val = torch.load(cache_path)
+    else:
+        dataset = generate_ringlookup_graph_dataset(nodes, samples=11000)
+        train, val = dataset[:10000], dataset[10000:]
+        os.makedirs(cache_dir, exist_ok=True)
+        torch.save((train, val), cache_path)
     dataset = train + val
 
     train_ids = list(range(len(train)))
@@ -0,0 +1,59 @@
+import pytest
+import torch
+
+from data.datasets import InMemoryComplexDataset
+from data.datasets.ringlookup import (RingLookupDataset, pack_collated,
+                                      unpack_collated, _load_packed)
+from data.dummy_complexes import get_mol_testing_complex_list
+
+
+def test_pack_unpack_collated_round_trip(tmp_path):
+    """The packed format must reproduce the collated storage exactly, including
+    the mangled feature key and the per-sample cell counts, both in memory and
+    after a save/load through the flat tensor-only file."""
+    complexes = get_mol_testing_complex_list()
+    for c, complex in enumerate(complexes):
+        complex.y = torch.LongTensor([c % 2])
+    max_dim = 2
+    data, slices = InMemoryComplexDataset.collate(complexes, max_dim)
+
+    path = str(tmp_path / 'packed.pt')
+    torch.save(pack_collated(data, slices, max_dim), path,
+               _use_new_zipfile_serialization=True)
+    new_data, new_slices = unpack_collated(_load_packed(path))
+
+    assert torch.equal(data['labels'], new_data['labels'])
+    assert torch.equal(data['dims'], new_data['dims'])
+    # The features are stored under the private attribute of Cochain, which
+    # must survive the round trip without going through the x setter.
+    assert '_Cochain__x' in data[0].keys
+    for dim in range(max_dim + 1):
+        cochain, new_cochain = data[dim], new_data[dim]
+        assert sorted(cochain.keys) == sorted(new_cochain.keys)
+        for key in cochain.keys:
+            assert torch.equal(cochain[key], new_cochain[key])
+        assert cochain.__num_cells__ == new_cochain.__num_cells__
+        assert cochain.__num_cells_up__ == new_cochain.__num_cells_up__
+        assert cochain.__num_cells_down__ == new_cochain.__num_cells_down__
+        for key in slices[dim]:
+            assert torch.equal(slices[dim][key], new_slices[dim][key])
+
+
+@pytest.mark.slow
+def test_ring_lookup_dataset_process_load_round_trip(tmp_path):
+    """Processing the dataset and loading it back must round trip. This
+    exercises the packed save format and the restoration of the bfloat16
+    features to full precision on load."""
+    root = str(tmp_path / 'RING-LOOKUP')
+    dataset = RingLookupDataset(root=root, nodes=5)
+
+    assert len(dataset.train_ids) == 10000
+    assert len(dataset.val_ids) == 1000
+    for dim in range(dataset.max_dim + 1):
+        assert dataset.data[dim].x.dtype == torch.float
+    dataset.get(0)
+
+    # A second instantiation reads back the files written by process().
+    reloaded = RingLookupDataset(root=root, nodes=5)
+    for dim in range(reloaded.max_dim + 1):
+        assert torch.equal(dataset.data[dim].x, reloaded.data[dim].x)
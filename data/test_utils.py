@@ -3,6 +3,7 @@ import torch
 from torch_geometric.data import Data
 from data.utils import compute_clique_complex_with_gudhi, compute_ring_2complex
 from data.utils import convert_graph_dataset_with_gudhi, convert_graph_dataset_with_rings
+from data.utils import sort_index_by_target
 from data.complex import ComplexBatch
 from data.dummy_complexes import convert_to_graph, get_testing_complex_list
 import pytest
@@ -631,3 +632,31 @@ def test_simp_complex_conversion_completes():
 def test_cell_complex_conversion_completes():
     graphs = list(map(convert_to_graph, get_testing_complex_list()))
     _ = convert_graph_dataset_with_rings(graphs, init_rings=True)
+
+
+def test_sort_index_by_target():
+    index = torch.tensor([[0, 1, 2, 3],
+                          [2, 0, 1, 0]], dtype=torch.long)
+    companion = torch.tensor([5, 6, 7, 8], dtype=torch.long)
+    sorted_index, sorted_companion = sort_index_by_target(index, companion)
+
+    # The aggregation (target) row must come out sorted and every
+    # (source, target, companion) column must survive the permutation.
+    assert torch.equal(sorted_index[1], torch.tensor([0, 0, 1, 2]))
+    columns = {(int(index[0, i]), int(index[1, i]), int(companion[i]))
+               for i in range(index.size(1))}
+    sorted_columns = {(int(sorted_index[0, i]), int(sorted_index[1, i]), int(sorted_companion[i]))
+                      for i in range(sorted_index.size(1))}
+    assert columns == sorted_columns
+
+
+def test_sort_index_by_target_on_sorted_and_empty_index():
+    index = torch.tensor([[1, 0, 2],
+                          [0, 1, 2]], dtype=torch.long)
+    sorted_index, companion = sort_index_by_target(index)
+    assert companion is None
+    assert torch.equal(sorted_index, index)
+
+    empty_index = torch.zeros(2, 0, dtype=torch.long)
+    sorted_index, _ = sort_index_by_target(empty_index)
+    assert sorted_index.shape == (2, 0)
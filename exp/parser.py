@@ -87,6 +87,9 @@ def get_parser():
                         help='fold index for k-fold cross-validation experiments')
     parser.add_argument('--folds', type=int, default=None,
                         help='The number of folds to run on in cross validation experiments')
+    parser.add_argument('--n_parallel_folds', type=int, default=1,
+                        help='How many cross-validation folds to run concurrently in run_tu_exp.'
+                             'For serial execution (e.g. on a single GPU) use "1"')
     parser.add_argument('--init_method', type=str, default='sum',
                         help='How to initialise features at higher levels (sum, mean)')
     parser.add_argument('--train_eval_period', type=int, default=10,
@@ -67,19 +67,26 @@ def main(args):
         os.makedirs(result_folder)
     filename = os.path.join(result_folder, 'results.txt')
 
+    # Keep loader workers alive across epochs and prefetch ahead, instead of
+    # paying the worker spawn cost at the start of every epoch.
+    loader_kwargs = {'num_workers': args.num_workers}
+    if args.num_workers > 0:
+        loader_kwargs['persistent_workers'] = True
+        loader_kwargs['prefetch_factor'] = 4
+
     if args.model.startswith('gin'):  # load graph dataset
         graph_list, train_ids, val_ids, test_ids, num_classes = load_graph_dataset(
             args.dataset, fold=args.fold, max_ring_size=args.max_ring_size)
         train_graphs = [graph_list[i] for i in train_ids]
         val_graphs = [graph_list[i] for i in val_ids]
         train_loader = PyGDataLoader(train_graphs, batch_size=args.batch_size,
-                                  shuffle=True, num_workers=args.num_workers)
+                                  shuffle=True, **loader_kwargs)
         valid_loader = PyGDataLoader(val_graphs, batch_size=args.batch_size,
-                                   shuffle=False, num_workers=args.num_workers)
+                                   shuffle=False, **loader_kwargs)
         if test_ids is not None:
             test_graphs = [graph_list[i] for i in test_ids]
             test_loader = PyGDataLoader(test_graphs, batch_size=args.batch_size,
-                                       shuffle=False, num_workers=args.num_workers)
+                                       shuffle=False, **loader_kwargs)
         else:
             test_loader = None
         if args.dataset.startswith('sr'):
@@ -104,14 +111,14 @@ def main(args):
 
         # Instantiate data loaders
         train_loader = DataLoader(dataset.get_split('train'), batch_size=args.batch_size,
-            shuffle=True, num_workers=args.num_workers, max_dim=dataset.max_dim)
+            shuffle=True, max_dim=dataset.max_dim, **loader_kwargs)
         valid_loader = DataLoader(dataset.get_split('valid'), batch_size=args.batch_size,
-            shuffle=False, num_workers=args.num_workers, max_dim=dataset.max_dim)
+            shuffle=False, max_dim=dataset.max_dim, **loader_kwargs)
         test_split = split_idx.get("test", None)
         test_loader = None
         if test_split is not None:
             test_loader = DataLoader(dataset.get_split('test'), batch_size=args.batch_size,
-                shuffle=False, num_workers=args.num_workers, max_dim=dataset.max_dim)
+                shuffle=False, max_dim=dataset.max_dim, **loader_kwargs)
 
     # Automatic evaluator, takes dataset name as input
     evaluator = Evaluator(args.eval_metric, eps=args.iso_eps)
@@ -3,6 +3,8 @@ import os
 import copy
 import time
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from exp.parser import get_parser
 from exp.run_exp import main
 
@@ -11,9 +13,22 @@ from exp.run_exp import main
 __num_folds__ = 10
 
 
+def run_fold(fold_args, device_id):
+    """Runs a single fold in a worker process, pinned to the given GPU.
+
+    CUDA_VISIBLE_DEVICES must be set before torch initialises CUDA in the worker,
+    hence the 'spawn' context used by the executor below.
+    """
+    os.environ['CUDA_VISIBLE_DEVICES'] = str(device_id)
+    parser = get_parser()
+    parsed_args = parser.parse_args(fold_args)
+    return main(parsed_args)
+
+
 def print_summary(summary):
+    """Prints per-fold values from a 1-D array (or any sequence of floats)."""
     msg = ''
-    for k, v in summary.items():
+    for k, v in enumerate(summary):
         msg += f'Fold {k:1d}:  {v:.3f}\n'
     print(msg)
     
@@ -25,11 +40,24 @@ def exp_main(passed_args):
 
     # run each experiment separately and gather results
     results = list()
-    for i in range(__num_folds__):
-        current_args = copy.copy(passed_args) + ['--fold', str(i)]
-        parsed_args = parser.parse_args(current_args)
-        curves = main(parsed_args)
-        results.append(curves)
+    if args.n_parallel_folds > 1:
+        import torch
+        num_gpus = max(torch.cuda.device_count(), 1)
+        # The folds are independent training runs, so we farm them out to worker
+        # processes and round-robin them over the available GPUs.
+        with ProcessPoolExecutor(max_workers=args.n_parallel_folds,
+                                 mp_context=get_context('spawn')) as executor:
+            futures = list()
+            for i in range(__num_folds__):
+                current_args = copy.copy(passed_args) + ['--fold', str(i)]
+                futures.append(executor.submit(run_fold, current_args, i % num_gpus))
+            results = [future.result() for future in futures]
+    else:
+        for i in range(__num_folds__):
+            current_args = copy.copy(passed_args) + ['--fold', str(i)]
+            parsed_args = parser.parse_args(current_args)
+            curves = main(parsed_args)
+            results.append(curves)
         
     # aggregate results
     val_curves = np.asarray([curves['val'] for curves in results])
@@ -38,25 +66,20 @@ def exp_main(passed_args):
     mean_perf = avg_val_curve[best_index]
     std_perf = val_curves.std(axis=0)[best_index]
 
-    print(" ===== Mean performance per fold ======")
-    perf_per_fold = val_curves.mean(1)
-    perf_per_fold = {i: perf_per_fold[i] for i in range(len(perf_per_fold))}
-    print_summary(perf_per_fold)
-
-    print(" ===== Max performance per fold ======")
-    perf_per_fold = np.max(val_curves, axis=1)
-    perf_per_fold = {i: perf_per_fold[i] for i in range(len(perf_per_fold))}
-    print_summary(perf_per_fold)
-
-    print(" ===== Median performance per fold ======")
-    perf_per_fold = np.median(val_curves, axis=1)
-    perf_per_fold = {i: perf_per_fold[i] for i in range(len(perf_per_fold))}
-    print_summary(perf_per_fold)
-
-    print(" ===== Performance on best epoch ======")
-    perf_per_fold = val_curves[:, best_index]
-    perf_per_fold = {i: perf_per_fold[i] for i in range(len(perf_per_fold))}
-    print_summary(perf_per_fold)
+    # All the per-fold summaries are derived from the same stacked array.
+    summaries = np.stack([
+        val_curves.mean(axis=1),
+        np.max(val_curves, axis=1),
+        np.median(val_curves, axis=1),
+        val_curves[:, best_index]])
+    headers = [
+        " ===== Mean performance per fold ======",
+        " ===== Max performance per fold ======",
+        " ===== Median performance per fold ======",
+        " ===== Performance on best epoch ======"]
+    for header, perf_per_fold in zip(headers, summaries):
+        print(header)
+        print_summary(perf_per_fold)
 
     print(" ===== Final result ======")
     msg = (
@@ -25,19 +25,69 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+import weakref
+
 from inspect import Parameter
 from typing import List, Optional, Set
 from torch_geometric.typing import Adj, Size
 
 import torch
 from torch import Tensor
-from torch_sparse import SparseTensor
+from torch_sparse import SparseTensor, matmul
 from torch_scatter import gather_csr, scatter, segment_csr
 
 from torch_geometric.nn.conv.utils.helpers import expand_left
 from mp.cell_mp_inspector import CellularInspector
 
 
+def _aggregate_messages(inputs: Tensor, agg_index: Tensor, ptr: Optional[Tensor],
+                        dim_size: Optional[int], node_dim: int, reduce: str) -> Tensor:
+    """The scatter/segment aggregation leaf, in TorchScript-compilable form."""
+    if ptr is not None:
+        expanded_ptr = expand_left(ptr, dim=node_dim, dims=inputs.dim())
+        return segment_csr(inputs, expanded_ptr, reduce=reduce)
+    return scatter(inputs, agg_index, dim=node_dim, dim_size=dim_size, reduce=reduce)
+
+
+def build_agg_ptr(index: Tensor, dim_size: int) -> Optional[Tensor]:
+    """Builds a CSR-style pointer for aggregating messages over the given index.
+
+    The pointer allows the aggregation to use segment_csr, which avoids the
+    atomic operations of scatter. Returns None when the aggregation index is
+    not sorted, in which case segment_csr cannot be used.
+    """
+    agg_index = index[1]
+    if agg_index.numel() > 0:
+        if bool((agg_index[1:] < agg_index[:-1]).any()):
+            return None
+        if int(agg_index[-1]) >= dim_size:
+            return None
+    counts = torch.bincount(agg_index, minlength=dim_size)
+    ptr = counts.new_zeros(dim_size + 1)
+    torch.cumsum(counts, dim=0, out=ptr[1:])
+    return ptr
+
+
+# Maps an aggregation index tensor to its (dim_size, ptr) pair. The weak keys
+# let the entries die together with the batch that owns the index tensors.
+_agg_ptr_cache = weakref.WeakKeyDictionary()
+
+
+def cached_agg_ptr(index: Tensor, dim_size: int) -> Optional[Tensor]:
+    """Memoised build_agg_ptr, keyed on the identity of the index tensor.
+
+    The models rebuild their CochainMessagePassingParams at every layer, so
+    without memoisation the sortedness scan of build_agg_ptr (and the device
+    sync it implies) would run per layer rather than once per batch.
+    """
+    cached = _agg_ptr_cache.get(index)
+    if cached is not None and cached[0] == dim_size:
+        return cached[1]
+    ptr = build_agg_ptr(index, dim_size)
+    _agg_ptr_cache[index] = (dim_size, ptr)
+    return ptr
+
+
 class CochainMessagePassing(torch.nn.Module):
     """The base class for building message passing models on cochain complexes.
 
@@ -78,6 +128,12 @@ class CochainMessagePassing(torch.nn.Module):
         'boundary_size_i', 'boundary_size_j', 'boundary_ptr', 'agg_boundary_index', 'boundary_dim_size',
     }
 
+    # The aggregation leaf compiled with TorchScript, shared by all instances.
+    # The full propagate cannot be scripted because of its dynamic kwargs, but
+    # scripting this innermost dispatch removes the Python overhead of the
+    # scatter/segment selection on every aggregation.
+    __jit_aggregate__ = None
+
     def __init__(self,
                  up_msg_size,
                  down_msg_size,
@@ -111,6 +167,10 @@ class CochainMessagePassing(torch.nn.Module):
         # i.e. if x has shape [N, in_channels], then node_dim = 0 or -2
         self.node_dim = node_dim
 
+        # Compile the aggregation leaf once and cache it on the class.
+        if CochainMessagePassing.__jit_aggregate__ is None:
+            CochainMessagePassing.__jit_aggregate__ = torch.jit.script(_aggregate_messages)
+
         self.inspector = CellularInspector(self)
         # This stores the parameters of these functions. If pop first is true
         # the first parameter is not stored (I presume this is for self.)
@@ -143,21 +203,94 @@ class CochainMessagePassing(torch.nn.Module):
         self.fuse_down = self.inspector.implements('message_and_aggregate_down')
         self.fuse_boundary = self.inspector.implements('message_and_aggregate_boundary')
 
+        # When the subclass keeps the default identity message and scatter
+        # aggregation, the two can be fused into a single spmm for sparse
+        # inputs, so the intermediate [E, F] message tensor is never materialised.
+        # The auto-enabled fusion is tracked separately because it is only
+        # valid for unweighted adjacencies (see __message_and_aggregate__).
+        self.auto_fuse_up = False
+        self.auto_fuse_down = False
+        if not self.fuse_up and self.aggr_up is not None \
+                and not self.inspector.implements('message_up') \
+                and not self.inspector.implements('aggregate_up'):
+            self.fuse_up = True
+            self.auto_fuse_up = True
+        if not self.fuse_down and self.aggr_down is not None \
+                and not self.inspector.implements('message_down') \
+                and not self.inspector.implements('aggregate_down'):
+            self.fuse_down = True
+            self.auto_fuse_down = True
+
+        # Precompute, for each adjacency, how every user arg is resolved in
+        # __collect__. This replaces the per-propagate string prefix checks and
+        # slicing with a lookup over frozen (arg, base_key, dim) triples.
+        self.__collect_plans__ = {}
+        for adjacency in ['up', 'down', 'boundary']:
+            self.__collect_plans__['update', adjacency] = self.__build_collect_plan__(
+                self.__update_user_args__, adjacency)
+            # The message passing collects also gather the update args, so the
+            # resulting dict can be reused for the update step of propagate.
+            self.__collect_plans__['user', adjacency] = self.__build_collect_plan__(
+                self.__user_args__ | self.__update_user_args__, adjacency)
+            self.__collect_plans__['fused', adjacency] = self.__build_collect_plan__(
+                self.__fused_user_args__ | self.__update_user_args__, adjacency)
+
+        # __collect__ fills a __slots__-based struct rather than a dict: slot
+        # access is faster than string-keyed dict lookups and missing args
+        # surface as unset slots instead of Parameter.empty entries. The struct
+        # type depends on the subclass signatures, so it is created per class.
+        cls = type(self)
+        if '__collect_struct__' not in cls.__dict__:
+            slots = set(self.special_args) | {'edge_index'}
+            slots |= self.__user_args__ | self.__fused_user_args__ | self.__update_user_args__
+            for adjacency in ['up', 'down', 'boundary']:
+                slots |= {f'{adjacency}_weight', f'{adjacency}_attr', f'{adjacency}_type'}
+            cls.__collect_struct__ = type(f'{cls.__name__}CollectKwargs', (),
+                                          {'__slots__': tuple(sorted(slots))})
+
+    @staticmethod
+    def __build_collect_plan__(args, adjacency):
+        """Resolves each user arg to an (arg, base_key, dim) triple ahead of time.
+
+        A base_key of None marks args passed through from the propagate kwargs as-is.
+        Args suffixed with _i/_j that belong to another adjacency are dropped.
+        """
+        prefix = f'{adjacency}_'
+        plan = []
+        for arg in args:
+            if arg[-2:] not in ['_i', '_j']:
+                plan.append((arg, None, None))
+            elif arg.startswith(prefix):
+                # Extract any part between the adjacency prefix and _j or _i.
+                # So for up_x_j extract x.
+                base = arg[len(prefix):-2]
+                dim = 0 if arg[-2:] == '_j' else 1
+                plan.append((arg, base, dim))
+        return plan
+
     def __check_input_together__(self, index_up, index_down, size_up, size_down):
         # If we have both up and down adjacency, then check the sizes agree.
-        if (index_up is not None and index_down is not None
-                and size_up is not None and size_down is not None):
-            assert size_up[0] == size_down[0]
-            assert size_up[1] == size_down[1]
+        # This is a pure consistency check, so the whole body is debug-only.
+        if __debug__:
+            if (index_up is not None and index_down is not None
+                    and size_up is not None and size_down is not None):
+                assert size_up[0] == size_down[0]
+                assert size_up[1] == size_down[1]
 
     def __check_input_separately__(self, index, size):
         """This gets an up or down index and the size of the assignment matrix"""
         the_size: List[Optional[int]] = [None, None]
 
+        # None is the most common case across adjacencies, so it is checked
+        # first. The shape validation is debug-only and stripped under -O.
+        if index is None:
+            return the_size
+
         if isinstance(index, Tensor):
-            assert index.dtype == torch.long
-            assert index.dim() == 2
-            assert index.size(0) == 2
+            if __debug__:
+                assert index.dtype == torch.long
+                assert index.dim() == 2
+                assert index.size(0) == 2
             if size is not None:
                 the_size[0] = size[0]
                 the_size[1] = size[1]
@@ -175,9 +308,6 @@ class CochainMessagePassing(torch.nn.Module):
             the_size[1] = index.sparse_size(0)
             return the_size
 
-        elif index is None:
-            return the_size
-
         raise ValueError(
             ('`MessagePassing.propagate` only supports `torch.LongTensor` of '
              'shape `[2, num_messages]` or `torch_sparse.SparseTensor` for '
@@ -185,11 +315,12 @@ class CochainMessagePassing(torch.nn.Module):
 
     def __set_size__(self, size: List[Optional[int]], dim: int, src: Tensor):
         the_size = size[dim]
+        src_size = src.size(self.node_dim)
         if the_size is None:
-            size[dim] = src.size(self.node_dim)
-        elif the_size != src.size(self.node_dim):
+            size[dim] = src_size
+        elif the_size != src_size:
             raise ValueError(
-                (f'Encountered tensor with size {src.size(self.node_dim)} in '
+                (f'Encountered tensor with size {src_size} in '
                  f'dimension {self.node_dim}, but expected size {the_size}.'))
 
     def __lift__(self, src, index, dim):
@@ -206,36 +337,26 @@ class CochainMessagePassing(torch.nn.Module):
                 return src.index_select(self.node_dim, col)
         raise ValueError
 
-    def __collect__(self, args, index, size, adjacency, kwargs):
+    def __collect__(self, plan, index, size, adjacency, kwargs):
         i, j = (1, 0) if self.flow == 'source_to_target' else (0, 1)
         assert adjacency in ['up', 'down', 'boundary']
 
-        out = {}
-        for arg in args:
+        out = self.__collect_struct__()
+        for arg, base, dim in plan:
             # Here the x_i and x_j parameters are automatically extracted
             # from an argument having the prefix x.
-            if arg[-2:] not in ['_i', '_j']:
-                out[arg] = kwargs.get(arg, Parameter.empty)
+            if base is None:
+                if arg in kwargs:
+                    setattr(out, arg, kwargs[arg])
             elif index is not None:
-                dim = 0 if arg[-2:] == '_j' else 1
-                # Extract any part up to _j or _i. So for x_j extract x
-                if adjacency == 'up' and arg.startswith('up_'):
-                    data = kwargs.get(arg[3:-2], Parameter.empty)
-                    size_data = data
-                elif adjacency == 'down' and arg.startswith('down_'):
-                    data = kwargs.get(arg[5:-2], Parameter.empty)
-                    size_data = data
-                elif adjacency == 'boundary' and arg.startswith('boundary_'):
-                    if dim == 0:
-                        # We need to use the boundary attribute matrix (i.e. boundary_attr) for the features
-                        # And we need to use the x matrix to extract the number of parent cells
-                        data = kwargs.get('boundary_attr', Parameter.empty)
-                        size_data = kwargs.get(arg[9:-2], Parameter.empty)
-                    else:
-                        data = kwargs.get(arg[9:-2], Parameter.empty)
-                        size_data = data
+                if adjacency == 'boundary' and dim == 0:
+                    # We need to use the boundary attribute matrix (i.e. boundary_attr) for the features
+                    # And we need to use the x matrix to extract the number of parent cells
+                    data = kwargs.get('boundary_attr', Parameter.empty)
+                    size_data = kwargs.get(base, Parameter.empty)
                 else:
-                    continue
+                    data = kwargs.get(base, Parameter.empty)
+                    size_data = data
 
                 # This was used before for the case when data is supplied directly
                 # as (x_i, x_j) as opposed to a matrix X [N, in_channels]
@@ -248,37 +369,40 @@ class CochainMessagePassing(torch.nn.Module):
                     # Same size checks as above.
                     self.__set_size__(size, dim, size_data)
                     # Select the features of the nodes indexed by i or j from the data matrix
-                    data = self.__lift__(data, index, j if arg[-2:] == '_j' else i)
+                    data = self.__lift__(data, index, j if dim == 0 else i)
 
-                out[arg] = data
+                setattr(out, arg, data)
 
         # Automatically builds some default parameters that can be used in the message passing
         # functions as needed. This was modified to be discriminative of upper and lower adjacency.
         if isinstance(index, Tensor):
-            out[f'{adjacency}_adj_t'] = None
-            out[f'{adjacency}_ptr'] = None
-            out[f'{adjacency}_index'] = index
-            out[f'{adjacency}_index_i'] = index[i]
-            out[f'{adjacency}_index_j'] = index[j]
+            setattr(out, f'{adjacency}_adj_t', None)
+            # A CSR pointer for the aggregation index may be precomputed by the
+            # caller (see build_agg_ptr), in which case the aggregation can use
+            # segment_csr instead of scatter.
+            setattr(out, f'{adjacency}_ptr', kwargs.get(f'{adjacency}_ptr', None))
+            setattr(out, f'{adjacency}_index', index)
+            setattr(out, f'{adjacency}_index_i', index[i])
+            setattr(out, f'{adjacency}_index_j', index[j])
         elif isinstance(index, SparseTensor):
-            out['edge_index'] = None
-            out[f'{adjacency}_adj_t'] = index
-            out[f'{adjacency}_index_i'] = index.storage.row()
-            out[f'{adjacency}_index_j'] = index.storage.col()
-            out[f'{adjacency}_ptr'] = index.storage.rowptr()
-            out[f'{adjacency}_weight'] = index.storage.value()
-            out[f'{adjacency}_attr'] = index.storage.value()
-            out[f'{adjacency}_type'] = index.storage.value()
+            out.edge_index = None
+            setattr(out, f'{adjacency}_adj_t', index)
+            setattr(out, f'{adjacency}_index_i', index.storage.row())
+            setattr(out, f'{adjacency}_index_j', index.storage.col())
+            setattr(out, f'{adjacency}_ptr', index.storage.rowptr())
+            setattr(out, f'{adjacency}_weight', index.storage.value())
+            setattr(out, f'{adjacency}_attr', index.storage.value())
+            setattr(out, f'{adjacency}_type', index.storage.value())
 
         # We need this if in contrast to pyg because index can be None for some adjacencies.
         if isinstance(index, Tensor) or isinstance(index, SparseTensor):
             # This is the old `index` argument used for aggregation of the messages.
-            out[f'agg_{adjacency}_index'] = out[f'{adjacency}_index_i']
+            setattr(out, f'agg_{adjacency}_index', getattr(out, f'{adjacency}_index_i'))
 
-        out[f'{adjacency}_size'] = size
-        out[f'{adjacency}_size_i'] = size[1] or size[0]
-        out[f'{adjacency}_size_j'] = size[0] or size[1]
-        out[f'{adjacency}_dim_size'] = out[f'{adjacency}_size_i']
+        setattr(out, f'{adjacency}_size', size)
+        setattr(out, f'{adjacency}_size_i', size[1] or size[0])
+        setattr(out, f'{adjacency}_size_j', size[0] or size[1])
+        setattr(out, f'{adjacency}_dim_size', getattr(out, f'{adjacency}_size_i'))
         return out
 
     def get_msg_and_agg_func(self, adjacency):
@@ -321,6 +445,15 @@ class CochainMessagePassing(torch.nn.Module):
         else:
             return None
 
+    def get_auto_fuse_boolean(self, adjacency):
+        if adjacency == 'up':
+            return self.auto_fuse_up
+        elif adjacency == 'down':
+            return self.auto_fuse_down
+        else:
+            # Boundary fusion is never enabled automatically.
+            return False
+
     def __message_and_aggregate__(self, index: Adj,
                                   adjacency: str,
                                   size: List[Optional[int]] = None,
@@ -329,20 +462,30 @@ class CochainMessagePassing(torch.nn.Module):
 
         # Fused message and aggregation
         fuse = self.get_fuse_boolean(adjacency)
+        if fuse and isinstance(index, SparseTensor) \
+                and self.get_auto_fuse_boolean(adjacency) \
+                and index.storage.value() is not None:
+            # The auto-fused default is an identity-message spmm, which would
+            # scale each message by the stored edge values. The unfused default
+            # path ignores those values, so weighted adjacencies must keep
+            # taking it to preserve the original semantics.
+            fuse = False
         if isinstance(index, SparseTensor) and fuse:
             # Collect the objects to pass to the function params in __user_arg.
-            coll_dict = self.__collect__(self.__fused_user_args__, index, size, adjacency, kwargs)
+            coll_dict = self.__collect__(self.__collect_plans__['fused', adjacency],
+                                         index, size, adjacency, kwargs)
 
             # message and aggregation are fused in a single function
             msg_aggr_kwargs = self.inspector.distribute(
                 f'message_and_aggregate_{adjacency}', coll_dict)
             message_and_aggregate = self.get_msg_and_agg_func(adjacency)
-            return message_and_aggregate(index, **msg_aggr_kwargs)
+            return message_and_aggregate(index, **msg_aggr_kwargs), coll_dict
 
         # Otherwise, run message and aggregation in separation.
         elif isinstance(index, Tensor) or not fuse:
             # Collect the objects to pass to the function params in __user_arg.
-            coll_dict = self.__collect__(self.__user_args__, index, size, adjacency, kwargs)
+            coll_dict = self.__collect__(self.__collect_plans__['user', adjacency],
+                                         index, size, adjacency, kwargs)
 
             # Up message and aggregation
             msg_kwargs = self.inspector.distribute(f'message_{adjacency}', coll_dict)
@@ -352,7 +495,7 @@ class CochainMessagePassing(torch.nn.Module):
             # import pdb; pdb.set_trace()
             aggr_kwargs = self.inspector.distribute(f'aggregate_{adjacency}', coll_dict)
             aggregate = self.get_agg_func(adjacency)
-            return aggregate(out, **aggr_kwargs)
+            return aggregate(out, **aggr_kwargs), coll_dict
 
     def propagate(self, up_index: Optional[Adj],
                   down_index: Optional[Adj],
@@ -368,27 +511,32 @@ class CochainMessagePassing(torch.nn.Module):
         self.__check_input_together__(up_index, down_index, up_size, down_size)
 
         up_out, down_out = None, None
+        up_coll_dict, down_coll_dict = None, None
         # Up messaging and aggregation
         if up_index is not None:
-            up_out = self.__message_and_aggregate__(up_index, 'up', up_size, **kwargs)
+            up_out, up_coll_dict = self.__message_and_aggregate__(
+                up_index, 'up', up_size, **kwargs)
 
         # Down messaging and aggregation
         if self.use_down_msg and down_index is not None:
-            down_out = self.__message_and_aggregate__(down_index, 'down', down_size, **kwargs)
+            down_out, down_coll_dict = self.__message_and_aggregate__(
+                down_index, 'down', down_size, **kwargs)
 
         # boundary messaging and aggregation
         boundary_out = None
         if self.use_boundary_msg and 'boundary_attr' in kwargs and kwargs['boundary_attr'] is not None:
-            boundary_out = self.__message_and_aggregate__(boundary_index, 'boundary', boundary_size, **kwargs)
-
-        coll_dict = {}
-        up_coll_dict = self.__collect__(self.__update_user_args__, up_index, up_size, 'up',
-                                        kwargs)
-        down_coll_dict = self.__collect__(self.__update_user_args__,
-                                          down_index, down_size, 'down', kwargs)
-        coll_dict.update(up_coll_dict)
-        coll_dict.update(down_coll_dict)
-        update_kwargs = self.inspector.distribute('update', coll_dict)
+            boundary_out, _ = self.__message_and_aggregate__(
+                boundary_index, 'boundary', boundary_size, **kwargs)
+
+        # The structs collected above already contain the update args, so a fresh
+        # collect is only needed for an adjacency whose branch did not run.
+        if up_coll_dict is None:
+            up_coll_dict = self.__collect__(self.__collect_plans__['update', 'up'],
+                                            up_index, up_size, 'up', kwargs)
+        if down_coll_dict is None:
+            down_coll_dict = self.__collect__(self.__collect_plans__['update', 'down'],
+                                              down_index, down_size, 'down', kwargs)
+        update_kwargs = self.inspector.distribute('update', (down_coll_dict, up_coll_dict))
         return self.update(up_out, down_out, boundary_out, **update_kwargs)
 
     def message_up(self, up_x_j: Tensor, up_attr: Tensor) -> Tensor:
@@ -432,12 +580,8 @@ class CochainMessagePassing(torch.nn.Module):
         that support "add", "mean" and "max" operations as specified in
         :meth:`__init__` by the :obj:`aggr` argument.
         """
-        if up_ptr is not None:
-            up_ptr = expand_left(up_ptr, dim=self.node_dim, dims=inputs.dim())
-            return segment_csr(inputs, up_ptr, reduce=self.aggr_up)
-        else:
-            return scatter(inputs, agg_up_index, dim=self.node_dim, dim_size=up_dim_size,
-                           reduce=self.aggr_up)
+        return self.__jit_aggregate__(
+            inputs, agg_up_index, up_ptr, up_dim_size, self.node_dim, self.aggr_up)
 
     def aggregate_down(self, inputs: Tensor, agg_down_index: Tensor,
                        down_ptr: Optional[Tensor] = None,
@@ -451,12 +595,8 @@ class CochainMessagePassing(torch.nn.Module):
         that support "add", "mean" and "max" operations as specified in
         :meth:`__init__` by the :obj:`aggr` argument.
         """
-        if down_ptr is not None:
-            down_ptr = expand_left(down_ptr, dim=self.node_dim, dims=inputs.dim())
-            return segment_csr(inputs, down_ptr, reduce=self.aggr_down)
-        else:
-            return scatter(inputs, agg_down_index, dim=self.node_dim, dim_size=down_dim_size,
-                           reduce=self.aggr_down)
+        return self.__jit_aggregate__(
+            inputs, agg_down_index, down_ptr, down_dim_size, self.node_dim, self.aggr_down)
 
     def aggregate_boundary(self, inputs: Tensor, agg_boundary_index: Tensor,
                        boundary_ptr: Optional[Tensor] = None,
@@ -470,33 +610,37 @@ class CochainMessagePassing(torch.nn.Module):
         that support "add", "mean" and "max" operations as specified in
         :meth:`__init__` by the :obj:`aggr` argument.
         """
-        # import pdb; pdb.set_trace()
-        if boundary_ptr is not None:
-            down_ptr = expand_left(boundary_ptr, dim=self.node_dim, dims=inputs.dim())
-            return segment_csr(inputs, down_ptr, reduce=self.aggr_boundary)
-        else:
-            return scatter(inputs, agg_boundary_index, dim=self.node_dim, dim_size=boundary_dim_size,
-                           reduce=self.aggr_boundary)
+        return self.__jit_aggregate__(
+            inputs, agg_boundary_index, boundary_ptr, boundary_dim_size, self.node_dim,
+            self.aggr_boundary)
 
-    def message_and_aggregate_up(self, up_adj_t: SparseTensor) -> Tensor:
+    def message_and_aggregate_up(self, up_adj_t: SparseTensor, x: Tensor) -> Tensor:
         r"""Fuses computations of :func:`message_up` and :func:`aggregate_up` into a
         single function.
         If applicable, this saves both time and memory since messages do not
         explicitly need to be materialized.
         This function will only gets called in case it is implemented and
         propagation takes place based on a :obj:`torch_sparse.SparseTensor`.
+
+        The default implementation performs the identity message followed by
+        aggregation as a single fused spmm. It is only used when the subclass
+        keeps the default :func:`message_up` and :func:`aggregate_up`.
         """
-        raise NotImplementedError
+        return matmul(up_adj_t, x, reduce=self.aggr_up)
 
-    def message_and_aggregate_down(self, down_adj_t: SparseTensor) -> Tensor:
+    def message_and_aggregate_down(self, down_adj_t: SparseTensor, x: Tensor) -> Tensor:
         r"""Fuses computations of :func:`message_down` and :func:`aggregate_down` into a
         single function.
         If applicable, this saves both time and memory since messages do not
         explicitly need to be materialized.
         This function will only gets called in case it is implemented and
         propagation takes place based on a :obj:`torch_sparse.SparseTensor`.
+
+        The default implementation performs the identity message followed by
+        aggregation as a single fused spmm. It is only used when the subclass
+        keeps the default :func:`message_down` and :func:`aggregate_down`.
         """
-        raise NotImplementedError
+        return matmul(down_adj_t, x, reduce=self.aggr_down)
 
     def message_and_aggregate_boundary(self, boundary_adj_t: SparseTensor) -> Tensor:
         r"""Fuses computations of :func:`message_boundary` and :func:`aggregate_boundary` into a
@@ -548,3 +692,15 @@ class CochainMessagePassingParams:
             self.boundary_attr = self.kwargs['boundary_attr']
         else:
             self.boundary_attr = None
+        # Precompute CSR pointers for the aggregation indices where possible.
+        # These params are rebuilt inside the per-layer loops of the models, so
+        # the construction is memoised on the index tensors: the sortedness
+        # check and pointer build run once per batch, not once per layer.
+        self.up_ptr = self._build_agg_ptr(up_index)
+        self.down_ptr = self._build_agg_ptr(down_index)
+        self.boundary_ptr = self._build_agg_ptr(self.boundary_index)
+
+    def _build_agg_ptr(self, index):
+        if isinstance(index, Tensor) and isinstance(self.x, Tensor):
+            return cached_agg_ptr(index, self.x.size(0))
+        return None
@@ -34,6 +34,13 @@ from torch_geometric.nn.conv.utils.inspector import Inspector
 class CellularInspector(Inspector):
     """Wrapper of the PyTorch Geometric Inspector so to adapt it to our use cases."""
 
+    def __init__(self, base_class: Any):
+        super(CellularInspector, self).__init__(base_class)
+        # Flattened (name, default) views of self.params, frozen at inspection
+        # time so distribute does not have to walk inspect.Parameter objects
+        # on every propagate call.
+        self.flat_params: Dict[str, Any] = {}
+
     def __implements__(self, cls, func_name: str) -> bool:
         if cls.__name__ == 'CochainMessagePassing':
             return False
@@ -47,3 +54,27 @@ class CellularInspector(Inspector):
         for _ in range(pop_first_n):
             params.popitem(last=False)
         self.params[func.__name__] = params
+        self.flat_params[func.__name__] = [
+            (name, param.default) for name, param in params.items()]
+
+    def distribute(self, func_name: str, sources):
+        """Extracts the args of the given function from the collected sources.
+
+        The sources are __slots__-based structs produced by __collect__; earlier
+        sources take precedence when a key is present in several of them.
+        """
+        if not isinstance(sources, tuple):
+            sources = (sources,)
+        out = {}
+        for key, default in self.flat_params[func_name]:
+            data = inspect.Parameter.empty
+            for source in sources:
+                data = getattr(source, key, inspect.Parameter.empty)
+                if data is not inspect.Parameter.empty:
+                    break
+            if data is inspect.Parameter.empty:
+                if default is inspect.Parameter.empty:
+                    raise TypeError(f'Required parameter {key} is empty.')
+                data = default
+            out[key] = data
+        return out
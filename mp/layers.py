@@ -35,7 +35,10 @@ class DummyCochainMessagePassing(CochainMessagePassing):
                                                     cochain.boundary_index, x=cochain.x,
                                                     up_attr=cochain.kwargs['up_attr'],
                                                     down_attr=cochain.kwargs['down_attr'],
-                                                    boundary_attr=cochain.kwargs['boundary_attr'])
+                                                    boundary_attr=cochain.kwargs['boundary_attr'],
+                                                    up_ptr=cochain.up_ptr,
+                                                    down_ptr=cochain.down_ptr,
+                                                    boundary_ptr=cochain.boundary_ptr)
         # down or boundary will be zero if one of them is not used.
         return cochain.x + up_out + down_out + boundary_out
 
@@ -79,7 +82,9 @@ class CINCochainConv(CochainMessagePassing):
         out_up, out_down, _ = self.propagate(cochain.up_index, cochain.down_index,
                                              None, x=cochain.x,
                                              up_attr=cochain.kwargs['up_attr'],
-                                             down_attr=cochain.kwargs['down_attr'])
+                                             down_attr=cochain.kwargs['down_attr'],
+                                             up_ptr=cochain.up_ptr,
+                                             down_ptr=cochain.down_ptr)
 
         out_up += (1 + self.eps) * cochain.x
         out_down += (1 + self.eps) * cochain.x
@@ -185,7 +190,9 @@ class SparseCINCochainConv(CochainMessagePassing):
         out_up, _, out_boundaries = self.propagate(cochain.up_index, cochain.down_index,
                                               cochain.boundary_index, x=cochain.x,
                                               up_attr=cochain.kwargs['up_attr'],
-                                              boundary_attr=cochain.kwargs['boundary_attr'])
+                                              boundary_attr=cochain.kwargs['boundary_attr'],
+                                              up_ptr=cochain.up_ptr,
+                                              boundary_ptr=cochain.boundary_ptr)
 
         # As in GIN, we can learn an injective update function for each multi-set
         out_up += (1 + self.eps1) * cochain.x
@@ -1,9 +1,10 @@
 import pytest
 import torch
 
+from torch_sparse import SparseTensor
 from data.helper_test import check_edge_index_are_the_same, check_edge_attr_are_the_same
 
-from mp.cell_mp import CochainMessagePassing
+from mp.cell_mp import CochainMessagePassing, build_agg_ptr
 from torch_geometric.nn.conv import MessagePassing
 from data.dummy_complexes import (get_square_dot_complex, get_house_complex,
                                   get_colon_complex, get_fullstop_complex, 
@@ -267,4 +268,54 @@ def test_cmp_messaging_with_replicated_adjs():
                                         [1+2+3+4],        # ring 2
                                         [2+3+5+6]],       # ring 1
                                       dtype=torch.float)
-    assert torch.equal(t_boundary_msg, expected_t_boundary_msg)
\ No newline at end of file
+    assert torch.equal(t_boundary_msg, expected_t_boundary_msg)
+
+
+def test_cmp_fused_and_unfused_paths_agree_on_sparse_input():
+    """
+    The default message/aggregate pair fuses into a single spmm for SparseTensor
+    inputs. The unfused path ignores any values stored in the sparse tensor, so
+    a weighted adjacency must fall back to it and both must match the result of
+    propagating with the equivalent edge index.
+    """
+    square_dot_complex = get_square_dot_complex()
+    params = square_dot_complex.get_cochain_params(dim=0)
+    num_cells = params.x.size(0)
+
+    cmp = CochainMessagePassing(up_msg_size=1, down_msg_size=1)
+    assert cmp.auto_fuse_up
+    up_msg, _, _ = cmp.propagate(params.up_index, None, None, x=params.x, up_attr=None)
+
+    # An unweighted SparseTensor takes the fused spmm path.
+    adj_t = SparseTensor(row=params.up_index[1], col=params.up_index[0],
+                         sparse_sizes=(num_cells, num_cells))
+    fused_up_msg, _, _ = cmp.propagate(adj_t, None, None, x=params.x, up_attr=None)
+    assert torch.equal(up_msg, fused_up_msg)
+
+    # A weighted SparseTensor must take the unfused path, whose default message
+    # ignores the stored values, and so yield the very same output.
+    value = torch.full((params.up_index.size(1),), 2, dtype=torch.float)
+    weighted_adj_t = SparseTensor(row=params.up_index[1], col=params.up_index[0],
+                                  value=value, sparse_sizes=(num_cells, num_cells))
+    unfused_up_msg, _, _ = cmp.propagate(weighted_adj_t, None, None, x=params.x, up_attr=None)
+    assert torch.equal(up_msg, unfused_up_msg)
+
+def test_build_agg_ptr_on_sorted_unsorted_and_empty_indices():
+    # A sorted aggregation index gets a CSR pointer with one segment per cell.
+    index = torch.tensor([[1, 2, 0, 1],
+                          [0, 0, 2, 3]], dtype=torch.long)
+    ptr = build_agg_ptr(index, dim_size=4)
+    assert torch.equal(ptr, torch.tensor([0, 2, 2, 3, 4]))
+
+    # An unsorted index cannot be aggregated with segment_csr.
+    unsorted_index = torch.tensor([[0, 1],
+                                   [1, 0]], dtype=torch.long)
+    assert build_agg_ptr(unsorted_index, dim_size=2) is None
+
+    # Targets beyond dim_size also fall back to the scatter path.
+    assert build_agg_ptr(index, dim_size=3) is None
+
+    # An empty index yields an all-zero pointer.
+    empty_index = torch.zeros(2, 0, dtype=torch.long)
+    ptr = build_agg_ptr(empty_index, dim_size=3)
+    assert torch.equal(ptr, torch.tensor([0, 0, 0, 0]))